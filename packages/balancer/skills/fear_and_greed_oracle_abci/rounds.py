@@ -18,10 +18,12 @@
 # ------------------------------------------------------------------------------
 
 """This package contains the rounds of FearAndGreedOracleAbciApp."""
-import json
+from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, FrozenSet, Optional, Set, Tuple, cast
 
+from orjson import loads as json_loads
+
 from packages.balancer.skills.fear_and_greed_oracle_abci.payloads import (
     EstimationRoundPayload,
     ObservationRoundPayload,
@@ -58,56 +60,71 @@ class SynchronizedData(BaseSynchronizedData):
     @property
     def participant_to_observations(self) -> Dict:
         """Get the participant_to_observations."""
-        return cast(Dict, self.db.get_strict("participant_to_observations"))
+        return self.db.get_strict("participant_to_observations")
 
     @property
     def most_voted_observation(self) -> Dict:
         """Get the participant_to_observations."""
-        return cast(Dict, self.db.get_strict("most_voted_observation"))
+        return self.db.get_strict("most_voted_observation")
 
     @property
     def participant_to_estimates(self) -> Dict:
         """Get the participant_to_estimates."""
-        return cast(Dict, self.db.get_strict("participant_to_estimates"))
+        return self.db.get_strict("participant_to_estimates")
 
     @property
     def most_voted_estimates(self) -> str:
         """Get the most_voted_estimates."""
-        return cast(str, self.db.get_strict("most_voted_estimates"))
+        return self.db.get_strict("most_voted_estimates")
 
 
-class ObservationRound(CollectSameUntilThresholdRound):
-    """A round in which agents collect observations"""
+class _DecodedPayloadRound(CollectSameUntilThresholdRound, ABC):
+    """A round which decodes the most voted payload and stores it in the db."""
 
-    payload_class = ObservationRoundPayload
-    payload_attribute = "observation_data"
-    synchronized_data_class = SynchronizedData
+    @abstractmethod
+    def _is_done(self, payload: Dict) -> bool:
+        """Check whether the decoded most voted payload allows to move on."""
 
     def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Event]]:
         """Process the end of the block."""
+        synchronized_data, collection = self.synchronized_data, self.collection
         if self.threshold_reached:
-            payload = json.loads(self.most_voted_payload)
+            payload = json_loads(self.most_voted_payload)
             if payload == {}:
-                return self.synchronized_data, Event.NO_ACTION
+                # an empty payload means that we don't take any action
+                return synchronized_data, Event.NO_ACTION
 
-            state = self.synchronized_data.update(
+            state = synchronized_data.update(
                 synchronized_data_class=self.synchronized_data_class,
                 **{
-                    get_name(
-                        SynchronizedData.participant_to_observations
-                    ): self.serialize_collection(self.collection),
-                    get_name(SynchronizedData.most_voted_observation): payload,
+                    self.collection_key: self.serialize_collection(collection),
+                    cast(str, self.selection_key): payload,
                 },
             )
-            return state, Event.DONE
-        if not self.is_majority_possible(
-            self.collection, self.synchronized_data.nb_participants
-        ):
-            return self.synchronized_data, Event.NO_MAJORITY
+            if self._is_done(payload):
+                return state, Event.DONE
+
+            return state, Event.NO_ACTION
+        if not self.is_majority_possible(collection, synchronized_data.nb_participants):
+            return synchronized_data, Event.NO_MAJORITY
 
         return None
 
 
+class ObservationRound(_DecodedPayloadRound):
+    """A round in which agents collect observations"""
+
+    payload_class = ObservationRoundPayload
+    payload_attribute = "observation_data"
+    synchronized_data_class = SynchronizedData
+    collection_key = get_name(SynchronizedData.participant_to_observations)
+    selection_key = get_name(SynchronizedData.most_voted_observation)
+
+    def _is_done(self, payload: Dict) -> bool:  # pylint: disable=unused-argument
+        """Any non-empty observation allows to move on."""
+        return True
+
+
 class EstimationRound(CollectSameUntilThresholdRound):
     """A round that in which the data processing logic is done."""
 
@@ -121,12 +138,14 @@ class EstimationRound(CollectSameUntilThresholdRound):
     selection_key = get_name(SynchronizedData.most_voted_estimates)
 
 
-class OutlierDetectionRound(CollectSameUntilThresholdRound):
+class OutlierDetectionRound(_DecodedPayloadRound):
     """A round in which outlier detection is done."""
 
     payload_class = OutlierDetectionRoundPayload
     payload_attribute = "outlier_detection_data"
     synchronized_data_class = SynchronizedData
+    collection_key = "participant_to_outlier_status"
+    selection_key = "most_voted_outlier_status"
 
     class OutlierStatus(Enum):
         """Defines the possible status the outlier check may result in."""
@@ -135,33 +154,10 @@ class OutlierDetectionRound(CollectSameUntilThresholdRound):
         OUTLIER_NOT_DETECTED = "outlier_not_detected"
         INVALID_STATE = "invalid_state"
 
-    def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Event]]:
-        """Process the end of the block."""
-        if self.threshold_reached:
-            payload = json.loads(self.most_voted_payload)
-            if payload == {}:
-                # this should never happen, however if it does
-                # we don't take any action
-                return self.synchronized_data, Event.NO_ACTION
-
-            status = payload.get("status", self.OutlierStatus.INVALID_STATE.value)
-            state = self.synchronized_data.update(
-                synchronized_data_class=self.synchronized_data_class,
-                participant_to_outlier_status=self.serialize_collection(
-                    self.collection
-                ),
-                most_voted_outlier_status=payload,
-            )
-            if status == self.OutlierStatus.OUTLIER_NOT_DETECTED.value:
-                return state, Event.DONE
-
-            return state, Event.NO_ACTION
-        if not self.is_majority_possible(
-            self.collection, self.synchronized_data.nb_participants
-        ):
-            return self.synchronized_data, Event.NO_MAJORITY
-
-        return None
+    def _is_done(self, payload: Dict) -> bool:
+        """Only move on if no outlier was detected."""
+        status = payload.get("status", self.OutlierStatus.INVALID_STATE.value)
+        return status == self.OutlierStatus.OUTLIER_NOT_DETECTED.value
 
 
 class FinishedDataCollectionRound(DegenerateRound):
@@ -56,6 +56,22 @@ from packages.valory.skills.abstract_round_abci.test_tools.base import (
 SAFE_CONTRACT_ADDRESS = "0x5564550A54EcD43bA8f7c666fff1C4762889A572"
 MANAGED_POOL_ADDRESS = "0xb5f3FC2579b134D836271AC872de2DA83Fe6e6a1"
 
+STATE_PERFORMATIVE = ContractApiMessage.Performative.STATE.value  # type: ignore
+ERROR_PERFORMATIVE = ContractApiMessage.Performative.ERROR.value  # type: ignore
+PERFORMATIVE_MISMATCH = (
+    f"Expected response performative {STATE_PERFORMATIVE}, "
+    f"received {ERROR_PERFORMATIVE}."
+)
+MANAGED_POOL_ERROR = (
+    "Couldn't get weights from IManagedPool.get_normalized_weights. "
+    f"{PERFORMATIVE_MISMATCH}"
+)
+POOL_ERROR = (
+    "Couldn't get tx data for ManagedPoolContract.update_weights_gradually. "
+    f"{PERFORMATIVE_MISMATCH}"
+)
+SAFE_CONTRACT_ERROR = f"Couldn't get safe hash. {PERFORMATIVE_MISMATCH}"
+
 
 @dataclass
 class BehaviourTestCase:
@@ -140,11 +156,6 @@ class TestDecisionMakingBehaviour(BasePoolManagerTest):
             1662854400.0,
         ],
     }
-    _managed_pool_error = (  # type: ignore
-        f"Couldn't get weights from IManagedPool.get_normalized_weights. "
-        f"Expected response performative {ContractApiMessage.Performative.STATE.value}, "  # type: ignore
-        f"received {ContractApiMessage.Performative.ERROR.value}."  # type: ignore
-    )
 
     def _mock_managed_pool_contract_request(
         self,
@@ -285,7 +296,7 @@ class TestDecisionMakingBehaviour(BasePoolManagerTest):
                 {
                     "mock_response_data": dict(),
                     "mock_failing_response_performative": ContractApiMessage.Performative.ERROR,
-                    "expected_error": _managed_pool_error,
+                    "expected_error": MANAGED_POOL_ERROR,
                 },
             )
         ],
@@ -318,16 +329,6 @@ class TestUpdatePoolTxBehaviour(BasePoolManagerTest):
     behaviour_class = UpdatePoolTxBehaviour
 
     _weights = [30, 40, 30]
-    _pool_error = (
-        f"Couldn't get tx data for ManagedPoolContract.update_weights_gradually. "
-        f"Expected response performative {ContractApiMessage.Performative.STATE.value}, "  # type: ignore
-        f"received {ContractApiMessage.Performative.ERROR.value}."  # type: ignore
-    )
-    _safe_contract_error = (
-        f"Couldn't get safe hash. "
-        f"Expected response performative {ContractApiMessage.Performative.STATE.value}, "  # type: ignore
-        f"received {ContractApiMessage.Performative.ERROR.value}."  # type: ignore
-    )
 
     def _mock_pool_contract_request(
         self,
@@ -433,7 +434,7 @@ class TestUpdatePoolTxBehaviour(BasePoolManagerTest):
                 {
                     "mock_response_data": dict(),
                     "mock_failing_response_performative": ContractApiMessage.Performative.ERROR,
-                    "expected_error": _pool_error,
+                    "expected_error": POOL_ERROR,
                 },
             )
         ],
@@ -481,7 +482,7 @@ class TestUpdatePoolTxBehaviour(BasePoolManagerTest):
                     ),
                     "mock_response_performative": ContractApiMessage.Performative.STATE,
                     "mock_failing_response_performative": ContractApiMessage.Performative.ERROR,
-                    "expected_error": _safe_contract_error,
+                    "expected_error": SAFE_CONTRACT_ERROR,
                 },
             )
         ],